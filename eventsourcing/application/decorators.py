@@ -16,13 +16,15 @@ def applicationpolicy(arg: Callable) -> Callable:
     @no_type_check
     def _mutator(func):
         wrapped = singledispatch(func)
+        dispatch = wrapped.dispatch
 
         @wraps(wrapped)
         def wrapper(*args, **kwargs):
             event = kwargs.get("event") or args[-1]
-            return wrapped.dispatch(type(event))(*args, **kwargs)
+            return dispatch(type(event))(*args, **kwargs)
 
         wrapper.register = wrapped.register
+        wrapper.dispatch = dispatch
 
         return wrapper
 
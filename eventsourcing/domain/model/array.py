@@ -144,9 +144,6 @@ class Array(object):
     def __eq__(self, other):
         return isinstance(other, type(self)) and self.id == other.id
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
-
 
 class BigArray(Array):
     """
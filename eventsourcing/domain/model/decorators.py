@@ -50,14 +50,17 @@ def subscribe_to(*args: Union[Callable, Type[DomainEvent]]) -> Callable:
     def wrap(func):
         def handler(event):
             if isinstance(event, (list, tuple)):
-                # Call handler once for each event.
+                # Call function once for each matching event.
                 for e in event:
-                    handler(e)
+                    if isinstance(e, (list, tuple)):
+                        handler(e)
+                    elif not args or isinstance(e, args):
+                        func(e)
             elif not args or isinstance(event, args):
                 # Call handler if there are no classes or have an instance.
                 func(event)
 
-        subscribe(handler=handler, predicate=lambda _: True)
+        subscribe(handler=handler)
         return func
 
     if len(args) == 1 and isfunction(args[0]):
@@ -119,6 +122,11 @@ def mutator(arg: Optional[Callable] = None) -> Callable:
             return initial(**event.__dict__)
 
         entity = mutate(None, Entity.Created())
+
+    The decorated function also has a 'dispatch' attribute, which
+    returns the handler registered for a given type of event, so
+    that the handler can be resolved once when many events of the
+    same type are to be applied.
     """
 
     domain_class = None
@@ -126,13 +134,15 @@ def mutator(arg: Optional[Callable] = None) -> Callable:
     @no_type_check
     def _mutator(func):
         wrapped = singledispatch(func)
+        dispatch = wrapped.dispatch
 
         @wraps(wrapped)
         def wrapper(initial, event):
             initial = initial or domain_class
-            return wrapped.dispatch(type(event))(initial, event)
+            return dispatch(type(event))(initial, event)
 
         wrapper.register = wrapped.register
+        wrapper.dispatch = dispatch
 
         return wrapper
 
@@ -308,9 +308,6 @@ class DomainEntity(Upcastable, EnduringObject, metaclass=MetaDomainEntity):
     def __eq__(self, other: object) -> bool:
         return type(self) == type(other) and self.__dict__ == other.__dict__
 
-    def __ne__(self, other: object) -> bool:
-        return not self.__eq__(other)
-
 
 TEntityWithHashchain = TypeVar("TEntityWithHashchain", bound="EntityWithHashchain")
 
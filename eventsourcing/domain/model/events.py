@@ -1,6 +1,16 @@
 from abc import abstractmethod
 from decimal import Decimal
-from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 from uuid import UUID, uuid1
 
 from eventsourcing.domain.model.versioning import Upcastable
@@ -42,9 +52,9 @@ class DomainEvent(Upcastable, ActualOccasion, Generic[TEntity]):
 
         :rtype: str
         """
-        sorted_items = tuple(sorted(self.__dict__.items()))
-        args_strings = ("{0}={1!r}".format(*item) for item in sorted_items)
-        args_string = ", ".join(args_strings)
+        args_string = ", ".join(
+            "{0}={1!r}".format(*item) for item in sorted(self.__dict__.items())
+        )
         return "{}({})".format(self.__class__.__qualname__, args_string)
 
     def __mutate__(self, obj: Optional[TEntity]) -> Optional[TEntity]:
@@ -90,16 +100,17 @@ class DomainEvent(Upcastable, ActualOccasion, Generic[TEntity]):
 
         :rtype: bool
         """
-        return isinstance(other, DomainEvent) and self.__hash__() == other.__hash__()
-
-    # Todo: Do we need this in Python 3?
-    def __ne__(self, other: object) -> bool:
-        """
-        Negates the equality test.
-
-        :rtype: bool
-        """
-        return not (self == other)
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            # Events with different topics have different hashes,
+            # since the topic is involved, so avoid calculating them.
+            # Distinct classes can have the same topic, though.
+            if not isinstance(other, DomainEvent) or (
+                get_topic(type(self)) != get_topic(type(other))
+            ):
+                return False
+        return self.__hash__() == other.__hash__()
 
     def __hash__(self) -> int:
         """
@@ -110,11 +121,9 @@ class DomainEvent(Upcastable, ActualOccasion, Generic[TEntity]):
         :return: Python integer hash
         :rtype: int
         """
-        attrs = self.__dict__.copy()
-
         # Involve the topic in the hash, so that different types
         # with same attribute values have different hash values.
-        attrs["__event_topic__"] = get_topic(type(self))
+        attrs = dict(self.__dict__, __event_topic__=get_topic(type(self)))
 
         # Calculate the cryptographic hash of the event.
         sha256_hash = self.__hash_object_v2__(attrs)
@@ -156,15 +165,16 @@ class EventWithHash(DomainEvent[TEntity]):
 
     def __init__(self, **kwargs: Any):
         super(EventWithHash, self).__init__(**kwargs)
+        state = self.__dict__
 
         # Set __event_topic__ to differentiate events of
         # different types with otherwise equal attributes.
-        self.__dict__["__event_topic__"] = get_topic(type(self))
+        state["__event_topic__"] = get_topic(type(self))
 
         # Set __event_hash__ with a SHA-256 hash of the event.
         hash_method = self.__hash_object_v2__
-        self.__dict__["__event_hash_method_name__"] = hash_method.__name__
-        self.__dict__["__event_hash__"] = hash_method(self.__dict__)
+        state["__event_hash_method_name__"] = hash_method.__name__
+        state["__event_hash__"] = hash_method(state)
 
     @property
     def __event_hash__(self) -> Any:
@@ -330,7 +340,26 @@ class LoggedEvent(DomainEvent[TEntity]):
 Predicate = Callable[[Sequence[TEvent]], bool]
 Handler = Callable[[Sequence[TEvent]], None]
 
-_subscriptions: List[Tuple[Optional[Predicate], Handler]] = []
+# Subscriptions are held in a tuple that is replaced (rather than
+# mutated) when handlers are subscribed or unsubscribed, so that
+# publish() can iterate over it without copying or locking, even if
+# a handler subscribes or unsubscribes whilst events are published.
+_subscriptions: Tuple[Tuple[Optional[Predicate], Handler], ...] = ()
+
+# Set of subscriptions, so that checking whether or not a
+# handler is already subscribed doesn't need to scan the tuple.
+# Subscriptions with unhashable handlers or predicates are not
+# in the set, and are found by scanning the tuple instead.
+_subscriptions_set: Set[Tuple[Optional[Predicate], Handler]] = set()
+
+_subscriptions_lock = Lock()
+
+
+def _is_subscribed(subscription: Tuple[Optional[Predicate], Handler]) -> bool:
+    try:
+        return subscription in _subscriptions_set
+    except TypeError:
+        return subscription in _subscriptions
 
 
 def subscribe(handler: Handler, predicate: Optional[Predicate] = None) -> None:
@@ -344,8 +373,15 @@ def subscribe(handler: Handler, predicate: Optional[Predicate] = None) -> None:
     :param callable handler: Will be called when an event is published.
     :param callable predicate: Conditions whether the handler will be called.
     """
-    if (predicate, handler) not in _subscriptions:
-        _subscriptions.append((predicate, handler))
+    global _subscriptions
+    subscription = (predicate, handler)
+    with _subscriptions_lock:
+        if not _is_subscribed(subscription):
+            try:
+                _subscriptions_set.add(subscription)
+            except TypeError:
+                pass
+            _subscriptions = _subscriptions + (subscription,)
 
 
 def unsubscribe(handler: Handler, predicate: Optional[Predicate] = None) -> None:
@@ -356,8 +392,15 @@ def unsubscribe(handler: Handler, predicate: Optional[Predicate] = None) -> None
     :param callable handler: Previously subscribed handler.
     :param callable predicate: Previously subscribed predicate.
     """
-    if (predicate, handler) in _subscriptions:
-        _subscriptions.remove((predicate, handler))
+    global _subscriptions
+    subscription = (predicate, handler)
+    with _subscriptions_lock:
+        if _is_subscribed(subscription):
+            try:
+                _subscriptions_set.discard(subscription)
+            except TypeError:
+                pass
+            _subscriptions = tuple(s for s in _subscriptions if s != subscription)
 
 
 def publish(events: Sequence[TEvent]) -> None:
@@ -371,22 +414,21 @@ def publish(events: Sequence[TEvent]) -> None:
     :param DomainEvent events: Domain event to be published.
     """
     # A cache of conditions means predicates aren't evaluated
-    # more than once for each event.
+    # more than once for each event. Predicates that can't be
+    # hashed are evaluated without the cache.
     cache: Dict[Predicate, bool] = {}
-    for predicate, handler in _subscriptions[:]:
+    for predicate, handler in _subscriptions:
         if predicate is None:
             handler(events)
         else:
-            cached_condition = cache.get(predicate)
-            if cached_condition is None:
+            try:
+                condition = cache.get(predicate)
+                if condition is None:
+                    condition = cache[predicate] = predicate(events)
+            except TypeError:
                 condition = predicate(events)
-                cache[predicate] = condition
-                if condition:
-                    handler(events)
-            elif cached_condition is True:
+            if condition:
                 handler(events)
-            else:
-                pass
 
 
 class EventHandlersNotEmptyError(Exception):
@@ -399,7 +441,7 @@ def assert_event_handlers_empty() -> None:
     there are no event handlers subscribed.
     """
     if len(_subscriptions):
-        msg = "subscriptions still exist: %s" % _subscriptions
+        msg = "subscriptions still exist: %s" % (_subscriptions,)
         raise EventHandlersNotEmptyError(msg)
 
 
@@ -407,10 +449,19 @@ def clear_event_handlers() -> None:
     """
     Removes all previously subscribed event handlers.
     """
-    _subscriptions.clear()
+    global _subscriptions
+    with _subscriptions_lock:
+        _subscriptions = ()
+        _subscriptions_set.clear()
 
 
 def create_timesequenced_event_id() -> UUID:
+    """
+    Returns a new UUIDv1, which is both unique and time-sequenced.
+
+    The value must be a version 1 UUID, since timestamps are
+    derived from event IDs (see decimaltimestamp_from_uuid()).
+    """
     return uuid1()
 
 
@@ -32,8 +32,9 @@ class Upcastable(Event):
     __class_version__ = 0
 
     def __init__(self):
-        if type(self).__class_version__ > 0:
-            self.__dict__["__class_version__"] = type(self).__class_version__
+        class_version = type(self).__class_version__
+        if class_version > 0:
+            self.__dict__["__class_version__"] = class_version
         super(Upcastable, self).__init__()
 
     @classmethod
@@ -1,4 +1,18 @@
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+from bisect import bisect_left, insort
+from collections import defaultdict
+from operator import attrgetter
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 from uuid import UUID
 
 from readerwriterlock.rwlock import RWLockFair
@@ -6,50 +20,66 @@ from readerwriterlock.rwlock import RWLockFair
 from eventsourcing.exceptions import RecordConflictError
 from eventsourcing.infrastructure.base import RecordManagerWithTracking, TrackingKwargs
 
+# Returned when there are no records, to avoid creating new empty
+# containers for each miss (or inserting them into the defaultdicts
+# whilst only holding the read lock). Callers must not mutate these.
+_EMPTY_RECORDS: Dict[int, NamedTuple] = {}
+_EMPTY_POSITIONS: List[int] = []
+_EMPTY_NOTIFICATIONS: Dict[int, Any] = {}
+_EMPTY_TRACKING_MAX: Dict[str, int] = {}
 
-class PopoNotification(object):
-    def __init__(
-        self,
-        notification_id: int,
-        originator_id: UUID,
-        originator_version: int,
-        topic: str,
-        state: str,
-    ):
-        self.notification_id = notification_id
-        self.originator_id = originator_id
-        self.originator_version = originator_version
-        self.topic = topic
-        self.state = state
+
+class PopoNotification(NamedTuple):
+    notification_id: int
+    originator_id: UUID
+    originator_version: int
+    topic: str
+    state: str
 
 
 class PopoRecordManager(RecordManagerWithTracking):
     def __init__(self, *args: Any, **kwargs: Any):
         super(PopoRecordManager, self).__init__(*args, **kwargs)
-        self._all_sequence_records: Dict[
-            Optional[str], Dict[UUID, Dict[int, NamedTuple]]
-        ] = {}
-        self._all_sequence_max: Dict = {}
-        self._all_tracking_records: Dict = {}
-        self._all_tracking_max: Dict = {}
-        self._all_notification_records: Dict[Optional[str], Dict[int, Any]] = {}
+        # Sequences are keyed by (application name, sequence ID), so
+        # that records can be found with fewer dict lookups.
+        self._all_sequence_records: DefaultDict[
+            Tuple[Optional[str], UUID], Dict[int, NamedTuple]
+        ] = defaultdict(dict)
+        self._all_sequence_max: Dict[Tuple[Optional[str], UUID], int] = {}
+        self._all_sequence_positions: DefaultDict[
+            Tuple[Optional[str], UUID], List[int]
+        ] = defaultdict(list)
+        # Sequence IDs of each application, in order of first insertion,
+        # so they can be listed without scanning every application's keys.
+        self._all_sequence_ids: DefaultDict[
+            Optional[str], Dict[UUID, None]
+        ] = defaultdict(dict)
+        self._all_tracking_records: DefaultDict[
+            Optional[str], DefaultDict[str, Set[int]]
+        ] = defaultdict(lambda: defaultdict(set))
+        self._all_tracking_max: DefaultDict[
+            Optional[str], Dict[str, int]
+        ] = defaultdict(dict)
+        self._all_notification_records: DefaultDict[
+            Optional[str], Dict[int, Any]
+        ] = defaultdict(dict)
         self._all_notification_max: Dict = {}
         self._rw_lock: RWLockFair = RWLockFair()
+        self._get_sequence_id = attrgetter(self.field_names.sequence_id)
+        self._get_position = attrgetter(self.field_names.position)
 
     def all_sequence_ids(self) -> List[UUID]:
-        ids: List[UUID] = []
         with self._rw_lock.gen_rlock():
-            try:
-                ids = list(self._all_sequence_records[self.application_name].keys())
-            except KeyError:
-                pass
+            ids = list(self._all_sequence_ids.get(self.application_name, ()))
         return ids
 
     def delete_record(self, record: Any) -> None:
         with self._rw_lock.gen_wlock():
-            sequence_records = self._get_sequence_records(record.sequence_id)
-            position = getattr(record, self.field_names.position)
-            sequence_records.pop(position, None)
+            sequence_id = self._get_sequence_id(record)
+            position = self._get_position(record)
+            sequence_records = self._get_sequence_records(sequence_id)
+            if sequence_records.pop(position, None) is not None:
+                self._get_sequence_positions(sequence_id).remove(position)
 
     def get_max_notification_id(self) -> int:
         with self._rw_lock.gen_rlock():
@@ -65,12 +95,9 @@ class PopoRecordManager(RecordManagerWithTracking):
             return max_notification_id
 
     def _get_notification_records(self) -> Dict[int, Any]:
-        notification_records: Dict[int, Any] = {}
-        try:
-            notification_records = self._all_notification_records[self.application_name]
-        except KeyError:
-            pass
-        return notification_records
+        return self._all_notification_records.get(
+            self.application_name, _EMPTY_NOTIFICATIONS
+        )
 
     def get_notification_records(
         self,
@@ -82,45 +109,35 @@ class PopoRecordManager(RecordManagerWithTracking):
         notifications = []
         with self._rw_lock.gen_rlock():
             notification_records = self._get_notification_records()
-            if start is None:
-                i = 1
-            else:
-                i = start + 1
-            while True:
-                if stop is not None and i >= stop + 1:
-                    break
-                try:
-                    notification_record = notification_records[i]
-                    notification = PopoNotification(
-                        notification_id=notification_record["notification_id"],
-                        originator_id=notification_record[
-                            "sequenced_item"
-                        ].originator_id,
-                        originator_version=notification_record[
-                            "sequenced_item"
-                        ].originator_version,
-                        topic=notification_record["sequenced_item"].topic,
-                        state=notification_record["sequenced_item"].state,
-                    )
-                    notifications.append(notification)
-                except KeyError:
-                    break
-                else:
-                    i += 1
+
+            # Notification IDs are contiguous from 1 to the max
+            # notification ID, so select IDs without probing for gaps.
+            max_notification_id = self._get_max_record_id()
+            if stop is None or stop > max_notification_id:
+                stop = max_notification_id
+            # Like the SQL record managers, a negative start selects from ID 1.
+            if start is None or start < 0:
+                start = 0
+            for i in range(start + 1, stop + 1):
+                notification_record = notification_records[i]
+                sequenced_item = notification_record["sequenced_item"]
+                notification = PopoNotification(
+                    notification_record["notification_id"],
+                    sequenced_item.originator_id,
+                    sequenced_item.originator_version,
+                    sequenced_item.topic,
+                    sequenced_item.state,
+                )
+                notifications.append(notification)
 
         return notifications
 
     def get_max_tracking_record_id(self, upstream_application_name: str) -> int:
-        max_id = 0
         with self._rw_lock.gen_rlock():
-            try:
-                app_records = self._all_tracking_records[self.application_name]
-                upstream_records = app_records[upstream_application_name]
-            except KeyError:
-                pass
-            else:
-                if len(upstream_records):
-                    max_id = max(upstream_records)
+            app_tracking_max = self._all_tracking_max.get(
+                self.application_name, _EMPTY_TRACKING_MAX
+            )
+            max_id = app_tracking_max.get(upstream_application_name, 0)
         return max_id
 
     def get_record(self, sequence_id: UUID, position: int) -> Any:
@@ -160,44 +177,40 @@ class PopoRecordManager(RecordManagerWithTracking):
             else:
                 end = min(end, lte + 1)
 
-        selected_records: List = []
         with self._rw_lock.gen_rlock():
             all_sequence_records = self._get_sequence_records(sequence_id)
             if not len(all_sequence_records):
                 return []
 
-            if end is None:
-                max_position = self._all_sequence_max[self.application_name][
-                    sequence_id
-                ]
-                end = max_position + 1
-            if start is None:
-                start = min(all_sequence_records.keys())
-
-            for position in range(start, end):
-                try:
-                    record = all_sequence_records[position]
-                except KeyError:
-                    pass
-                else:
-                    selected_records.append(record)
+            # Select positions in range from the sorted list of
+            # positions, rather than probing for each position.
+            positions = self._get_sequence_positions(sequence_id)
+            lo = 0 if start is None else bisect_left(positions, start)
+            hi = len(positions) if end is None else bisect_left(positions, end)
+            selected_positions = positions[lo:hi]
 
             if not query_ascending:
-                selected_records = list(reversed(selected_records))
+                selected_positions.reverse()
 
             if limit is not None:
-                selected_records = list(selected_records)[:limit]
+                selected_positions = selected_positions[:limit]
 
             if query_ascending != results_ascending:
-                selected_records = list(reversed(selected_records))
+                selected_positions.reverse()
+
+            selected_records = [all_sequence_records[p] for p in selected_positions]
 
         return selected_records
 
     def _get_sequence_records(self, sequence_id: UUID) -> Dict:
-        try:
-            return self._all_sequence_records[self.application_name][sequence_id]
-        except KeyError:
-            return {}
+        return self._all_sequence_records.get(
+            (self.application_name, sequence_id), _EMPTY_RECORDS
+        )
+
+    def _get_sequence_positions(self, sequence_id: UUID) -> List[int]:
+        return self._all_sequence_positions.get(
+            (self.application_name, sequence_id), _EMPTY_POSITIONS
+        )
 
     def has_tracking_record(
         self, upstream_application_name: str, pipeline_id: int, notification_id: int
@@ -229,22 +242,9 @@ class PopoRecordManager(RecordManagerWithTracking):
                     application_name,
                     self.application_name,
                 )
-                try:
-                    app_tracking_records = self._all_tracking_records[application_name]
-                except KeyError:
-                    app_tracking_records = {}
-                    self._all_tracking_records[
-                        self.application_name
-                    ] = app_tracking_records
-                try:
-                    upstream_tracking_records = app_tracking_records[
-                        upstream_application_name
-                    ]
-                except KeyError:
-                    upstream_tracking_records = set()
-                    app_tracking_records[
-                        upstream_application_name
-                    ] = upstream_tracking_records
+                upstream_tracking_records = self._all_tracking_records[
+                    application_name
+                ][upstream_application_name]
 
                 if notification_id in upstream_tracking_records:
                     raise RecordConflictError(
@@ -252,28 +252,24 @@ class PopoRecordManager(RecordManagerWithTracking):
                     )
                 upstream_tracking_records.add(notification_id)
 
+                # Track the max notification ID, to avoid calculating it.
+                app_tracking_max = self._all_tracking_max[application_name]
+                app_tracking_max[upstream_application_name] = max(
+                    notification_id, app_tracking_max.get(upstream_application_name, 0)
+                )
+
     def _insert_record(self, sequenced_item: NamedTuple) -> None:
-        position = getattr(sequenced_item, self.field_names.position)
+        position = self._get_position(sequenced_item)
         if not isinstance(position, int):
             raise NotImplementedError(
                 "Popo record manager only supports sequencing with integers, "
                 "but position was a {}".format(type(position))
             )
 
-        sequence_id = getattr(sequenced_item, self.field_names.sequence_id)
-        try:
-            application_records = self._all_sequence_records[self.application_name]
-        except KeyError:
-            sequence_records: Dict[int, NamedTuple] = {}
-            application_records = {sequence_id: sequence_records}
-            self._all_sequence_records[self.application_name] = application_records
-            self._all_sequence_max[self.application_name] = {}
-        else:
-            try:
-                sequence_records = application_records[sequence_id]
-            except KeyError:
-                sequence_records = {}
-                application_records[sequence_id] = sequence_records
+        sequence_id = self._get_sequence_id(sequenced_item)
+        sequence_key = (self.application_name, sequence_id)
+        sequence_records = self._all_sequence_records[sequence_key]
+        sequence_positions = self._all_sequence_positions[sequence_key]
 
         if position in sequence_records:
             raise RecordConflictError(position, len(sequence_records))
@@ -281,10 +277,7 @@ class PopoRecordManager(RecordManagerWithTracking):
         if self.notification_id_name:
             # Just make sure we aren't making a gap in the sequence.
             if sequence_records:
-                max_position = self._all_sequence_max[self.application_name][
-                    sequence_id
-                ]
-                next_position = max_position + 1
+                next_position = self._all_sequence_max[sequence_key] + 1
             else:
                 next_position = 0
             if position != next_position:
@@ -295,20 +288,13 @@ class PopoRecordManager(RecordManagerWithTracking):
                 )
 
         sequence_records[position] = sequenced_item
-        self._all_sequence_max[self.application_name][sequence_id] = position
+        insort(sequence_positions, position)
+        self._all_sequence_max[sequence_key] = position
+        self._all_sequence_ids[self.application_name][sequence_id] = None
 
         # Write a notification record.
         if self.notification_id_name:
-            try:
-                notification_records = self._all_notification_records[
-                    self.application_name
-                ]
-            except KeyError:
-                notification_records = {}
-                self._all_notification_records[
-                    self.application_name
-                ] = notification_records
-
+            notification_records = self._all_notification_records[self.application_name]
             next_notification_id = (self._get_max_record_id() or 0) + 1
             notification_records[next_notification_id] = {
                 "notification_id": next_notification_id,
@@ -92,6 +92,9 @@ class TestDecorators(TestCase):
         # Check it dispatches on type of last arg.
         self.assertIsInstance(mutate_entity(None, Event()), Entity)
 
+        # Check the registered handler can be resolved directly.
+        self.assertIs(mutate_entity.dispatch(Event), mutate_with_event)
+
         # Check it handles unregistered types.
         with self.assertRaises(NotImplementedError):
             mutate_entity(None, None)
@@ -65,6 +65,14 @@ class TestAbstractDomainEvent(TestCase):
 
         self.assertNotEqual(event2, SubclassEvent(name=event2.name))
 
+        # Check equal to a distinct class with the same topic, by value.
+        SameTopicEvent = type(
+            "Event", (Event,), {"__qualname__": "Event", "__module__": __name__}
+        )
+        self.assertEqual(get_topic(SameTopicEvent), get_topic(Event))
+        self.assertEqual(event2, SameTopicEvent(name="value"))
+        self.assertNotEqual(event2, SameTopicEvent(name="another value"))
+
 
 class TestEventWithOriginatorID(TestCase):
     def test(self):
@@ -391,6 +399,91 @@ class TestEvents(TestCase):
         # Check we can assert there are no event handlers subscribed.
         assert_event_handlers_empty()
 
+    def test_subscribe_twice(self):
+        # Check subscribing the same handler and predicate twice
+        # means the handler is only called once per publish.
+        event = mock.Mock()
+        predicate = mock.Mock(return_value=True)
+        handler = mock.Mock()
+        subscribe(handler=handler, predicate=predicate)
+        subscribe(handler=handler, predicate=predicate)
+        publish([event])
+        handler.assert_called_once_with([event])
+
+        # Check a single unsubscribe removes the subscription.
+        unsubscribe(handler=handler, predicate=predicate)
+        assert_event_handlers_empty()
+
+    def test_subscribe_unhashable_handler(self):
+        # Check handlers that can't be hashed can be subscribed.
+        class Handler(object):
+            def __init__(self):
+                self.events = []
+
+            def __eq__(self, other):
+                return isinstance(other, Handler) and self.events == other.events
+
+            def __call__(self, events):
+                self.events.append(events)
+
+        handler = Handler()
+        self.assertIsNone(Handler.__hash__)
+        event = mock.Mock()
+        subscribe(handler=handler)
+        subscribe(handler=handler)
+        publish([event])
+        self.assertEqual(handler.events, [[event]])
+
+        unsubscribe(handler=handler)
+        assert_event_handlers_empty()
+
+    def test_subscribe_unhashable_predicate(self):
+        # Check predicates that can't be hashed can be subscribed,
+        # and don't stop events being published to other handlers.
+        class Predicate(object):
+            def __init__(self):
+                self.calls = 0
+
+            def __eq__(self, other):
+                return isinstance(other, Predicate) and self.calls == other.calls
+
+            def __call__(self, events):
+                self.calls += 1
+                return True
+
+        predicate = Predicate()
+        self.assertIsNone(Predicate.__hash__)
+        event = mock.Mock()
+        handler1 = mock.Mock()
+        handler2 = mock.Mock()
+        subscribe(handler=handler1, predicate=predicate)
+        subscribe(handler=handler2)
+        publish([event])
+        self.assertEqual(predicate.calls, 1)
+        handler1.assert_called_once_with([event])
+        handler2.assert_called_once_with([event])
+
+        unsubscribe(handler=handler1, predicate=predicate)
+        unsubscribe(handler=handler2)
+        assert_event_handlers_empty()
+
+    def test_unsubscribe_whilst_publishing(self):
+        # Check a handler can unsubscribe itself whilst an event
+        # is being published, without other handlers being skipped.
+        event = mock.Mock()
+        handler2 = mock.Mock()
+
+        def handler1(events):
+            unsubscribe(handler=handler1)
+
+        subscribe(handler=handler1)
+        subscribe(handler=handler2)
+        publish([event])
+        handler2.assert_called_once_with([event])
+
+        unsubscribe(handler=handler2)
+        assert_event_handlers_empty()
+
     def test_hash(self):
         entity_id1 = uuid4()
         event1 = Example.Created(
@@ -470,6 +563,30 @@ class TestEvents(TestCase):
         with self.assertRaises(TopicResolutionError):
             resolve_topic("eventsourcing.domain.model.events#Broken")
 
+    def test_topic_resolution_repeated(self):
+        # Check resolving and getting topics repeatedly gives the same results.
+        topic = get_topic(Example.Created)
+        self.assertEqual(topic, get_topic(Example.Created))
+        self.assertIs(resolve_topic(topic), Example.Created)
+        self.assertIs(resolve_topic(topic), Example.Created)
+
+        # Check a subclass doesn't inherit the topic of its base class.
+        self.assertTrue(get_topic(Event).endswith("#Event"))
+        self.assertTrue(get_topic(SubclassEvent).endswith("#SubclassEvent"))
+
+        # Check a class attribute named '__topic__' isn't used or replaced.
+        class TopicEvent(Event):
+            __topic__ = "something else"
+
+        self.assertTrue(get_topic(TopicEvent).endswith(".TopicEvent"))
+        self.assertEqual(TopicEvent.__topic__, "something else")
+
+        # Check a failed resolution isn't remembered.
+        with self.assertRaises(TopicResolutionError):
+            resolve_topic("eventsourcing.domain.model.events#Broken")
+        with self.assertRaises(TopicResolutionError):
+            resolve_topic("eventsourcing.domain.model.events#Broken")
+
 
 class TestEventWithHash(TestCase):
     def test_event_hash_versioning(self):
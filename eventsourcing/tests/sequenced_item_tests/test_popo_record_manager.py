@@ -1,5 +1,10 @@
+from unittest import TestCase
+from uuid import uuid4
+
 from eventsourcing.infrastructure.popo.factory import PopoInfrastructureFactory
 from eventsourcing.infrastructure.popo.mapper import SequencedItemMapperForPopo
+from eventsourcing.infrastructure.popo.records import StoredEventRecord
+from eventsourcing.infrastructure.sequenceditem import StoredEvent
 from eventsourcing.tests.sequenced_item_tests import base
 
 
@@ -29,6 +34,110 @@ class TestPopoRecordManagerWithoutContiguousRecordIDs(
         return self.construct_entity_record_manager()
 
 
+class TestPopoRecordManagerWithStoredEvents(TestCase):
+    def setUp(self):
+        factory = PopoInfrastructureFactory(
+            application_name="app",
+            sequenced_item_class=StoredEvent,
+            integer_sequenced_record_class=StoredEventRecord,
+            contiguous_record_ids=True,
+        )
+        self.record_manager = factory.construct_integer_sequenced_record_manager()
+        self.originator_id = uuid4()
+
+    def record_items(self, *positions):
+        self.record_manager.record_items(
+            [
+                StoredEvent(self.originator_id, position, "topic", str(position))
+                for position in positions
+            ]
+        )
+
+    def get_positions(self, **kwargs):
+        records = self.record_manager.get_records(self.originator_id, **kwargs)
+        return [record.originator_version for record in records]
+
+    def test_delete_record(self):
+        self.record_items(0, 1, 2)
+        record = self.record_manager.get_record(self.originator_id, 1)
+
+        # Check a record can be deleted (field names are from StoredEvent).
+        self.record_manager.delete_record(record)
+        self.assertEqual(self.get_positions(), [0, 2])
+        with self.assertRaises(IndexError):
+            self.record_manager.get_record(self.originator_id, 1)
+
+    def test_get_record_from_missing_sequence(self):
+        self.assertEqual(self.record_manager.all_sequence_ids(), [])
+
+        # Check getting a record doesn't create the sequence.
+        with self.assertRaises(IndexError):
+            self.record_manager.get_record(uuid4(), 0)
+        self.assertEqual(self.record_manager.all_sequence_ids(), [])
+
+    def test_all_sequence_ids(self):
+        self.record_items(0)
+        other_id = uuid4()
+        self.record_manager.record_items([StoredEvent(other_id, 0, "topic", "0")])
+        self.record_items(1)
+
+        # Check sequence IDs are listed once, in order of first insertion.
+        self.assertEqual(
+            self.record_manager.all_sequence_ids(), [self.originator_id, other_id]
+        )
+
+        # Check a failed insert doesn't list the sequence.
+        with self.assertRaises(AssertionError):
+            self.record_manager.record_items([StoredEvent(uuid4(), 1, "topic", "1")])
+        self.assertEqual(
+            self.record_manager.all_sequence_ids(), [self.originator_id, other_id]
+        )
+
+    def test_get_notification_records(self):
+        self.record_items(0, 1, 2, 3)
+
+        def get_notification_ids(*args):
+            records = self.record_manager.get_notification_records(*args)
+            return [record.notification_id for record in records]
+
+        self.assertEqual(get_notification_ids(), [1, 2, 3, 4])
+        self.assertEqual(get_notification_ids(1, 3), [2, 3])
+        self.assertEqual(get_notification_ids(2, 100), [3, 4])
+        self.assertEqual(get_notification_ids(4), [])
+
+        # Check a negative start selects from the first notification.
+        self.assertEqual(get_notification_ids(-5, 2), [1, 2])
+
+    def test_get_records_with_sparse_positions_written_out_of_order(self):
+        # Without notification records, positions needn't be contiguous.
+        factory = PopoInfrastructureFactory(
+            application_name="app", sequenced_item_class=StoredEvent
+        )
+        self.record_manager = factory.construct_integer_sequenced_record_manager()
+        self.assertFalse(self.record_manager.notification_id_name)
+        self.record_items(10, 2, 7, 0, 5)
+
+        self.assertEqual(self.get_positions(), [0, 2, 5, 7, 10])
+        self.assertEqual(self.get_positions(gt=2), [5, 7, 10])
+        self.assertEqual(self.get_positions(gte=2, lt=10), [2, 5, 7])
+        self.assertEqual(self.get_positions(gt=0, lte=7), [2, 5, 7])
+        self.assertEqual(self.get_positions(gt=10), [])
+
+        # Check limit, and descending queries.
+        self.assertEqual(self.get_positions(limit=2), [0, 2])
+        self.assertEqual(self.get_positions(limit=2, query_ascending=False), [7, 10])
+        self.assertEqual(
+            self.get_positions(limit=2, query_ascending=False, results_ascending=False),
+            [10, 7],
+        )
+        self.assertEqual(
+            self.get_positions(
+                lt=10, limit=2, query_ascending=False, results_ascending=False
+            ),
+            [7, 5],
+        )
+
+
 #
 # class TestPopoRecordManagerWithTimestampSequences(PopoTestCase, base.TimestampSequencedItemTestCase):
 #     def construct_record_manager(self):
@@ -1,23 +1,47 @@
 import importlib
+import sys
 from typing import Any, Dict, Type
 
 from eventsourcing.domain.model.versioning import Upcastable
 from eventsourcing.exceptions import TopicResolutionError
 from eventsourcing.whitehead import T
 
+# Cache of classes resolved from topics, since the same
+# few topics are resolved for each event that is retrieved.
+_topic_cache: Dict[str, Any] = {}
+
+# Cache of topics for classes that can't have attributes set
+# (such as builtin types). Other classes cache their own topic.
+_class_topic_cache: Dict[type, str] = {}
+
 
 def get_topic(domain_class: type) -> str:
     """
     Returns a string describing a class.
 
+    As a side effect, the topic is cached on the given class, by
+    setting its '__eventsourcing_topic__' attribute. The class dict
+    is used, so that subclasses don't inherit the topic. Classes
+    that can't have attributes set (such as builtin types) are
+    not changed.
+
     :param domain_class: A class.
     :returns: A string describing the class.
     """
-    return (
-        domain_class.__module__
-        + "#"
-        + getattr(domain_class, "__qualname__", domain_class.__name__)
-    )
+    try:
+        return domain_class.__dict__["__eventsourcing_topic__"]
+    except KeyError:
+        pass
+    try:
+        return _class_topic_cache[domain_class]
+    except KeyError:
+        pass
+    topic = domain_class.__module__ + "#" + domain_class.__qualname__
+    try:
+        setattr(domain_class, "__eventsourcing_topic__", topic)
+    except (AttributeError, TypeError):
+        _class_topic_cache[domain_class] = topic
+    return topic
 
 
 # Todo: Write documentation for this feature (versioning...).
@@ -37,26 +61,38 @@ def resolve_topic(topic: str) -> Any:
     #  - this allows classes to be moved and renamed
     topic = substitutions.get(topic, topic)
 
+    try:
+        return _topic_cache[topic]
+    except KeyError:
+        pass
+
     # Partition topic into module and class names.
     module_name, _, class_name = topic.partition("#")
 
-    # Import the module.
-    try:
-        module = importlib.import_module(module_name)
-    except ImportError as e:
-        raise TopicResolutionError("{}: {}".format(topic, e))
+    # Import the module (unless it has already been imported). A module
+    # that is still being imported by another thread may be incomplete,
+    # so then call import_module(), which waits for the import to finish.
+    module = sys.modules.get(module_name)
+    if module is None or getattr(
+        getattr(module, "__spec__", None), "_initializing", False
+    ):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            raise TopicResolutionError("{}: {}".format(topic, e))
 
     # Identify the class.
     try:
         cls = resolve_attr(module, class_name)
     except AttributeError as e:
         raise TopicResolutionError("{}: {}".format(topic, e))
+    _topic_cache[topic] = cls
     return cls
 
 
 def resolve_attr(obj: Any, path: str) -> Any:
     """
-    A recursive version of getattr for navigating dotted paths.
+    A version of getattr for navigating dotted paths.
 
     :param obj: An object for which we want to retrieve a nested attribute.
     :param path: A dot separated string containing zero or more attribute names.
@@ -65,9 +101,9 @@ def resolve_attr(obj: Any, path: str) -> Any:
     """
     if not path:
         return obj
-    head, _, tail = path.partition(".")
-    head_obj = getattr(obj, head)
-    return resolve_attr(head_obj, tail)
+    for name in path.split("."):
+        obj = getattr(obj, name)
+    return obj
 
 
 def reconstruct_object(obj_class: Type[T], obj_state: Dict[str, Any]) -> T: